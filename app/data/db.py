@@ -6,23 +6,45 @@ DB_PATH = DATA_DIR / "intelligence_platform.db"
 
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-def connect_database(db_path=DB_PATH):
-    """Return a connection to the SQLite database."""
-    return sqlite3.connect(str(db_path))
-
-# 🔥 THIS PART ACTUALLY CREATES THE DATABASE FILE
-conn = connect_database()
-cursor = conn.cursor()
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS test_table (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT
-)
-""")
+# Resolved once at import time; every connect after that skips the
+# resolve() stat calls and the Path-to-str conversion
+_RESOLVED_DB_PATH = str(DB_PATH.resolve())
 
-conn.commit()
-conn.close()
-
-print("Database created at:", DB_PATH.resolve())
+def connect_database(db_path=_RESOLVED_DB_PATH):
+    """Return a connection to the SQLite database."""
+    conn = sqlite3.connect(db_path)
+    # WAL lets readers run alongside the writer, and NORMAL skips the
+    # per-commit fsync that dominates small-write latency
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+def bulk_insert(conn, sql, rows, chunk=1000):
+    """Insert many rows under one transaction instead of a commit per row."""
+    with conn:
+        for start in range(0, len(rows), chunk):
+            conn.executemany(sql, rows[start:start + chunk])
+
+def init_schema():
+    """Create the database file and its baseline table."""
+    conn = connect_database()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS test_table (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT
+    )
+    """)
+
+    conn.commit()
+    conn.close()
+
+    print("Database created at:", _RESOLVED_DB_PATH)
+
+
+# 🔥 THIS PART ACTUALLY CREATES THE DATABASE FILE (only when run directly)
+if __name__ == "__main__":
+    init_schema()
 
@@ -1,42 +1,43 @@
-import bcrypt
-from pathlib import Path
+_USERS_DDL = """CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, password_hash TEXT NOT NULL, role TEXT DEFAULT 'user', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"""
+
+_CYBER_INCIDENTS_DDL = """CREATE TABLE IF NOT EXISTS cyber_incidents (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT, incident_type TEXT, severity TEXT, status TEXT, description TEXT, reported_by TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"""
+
+_DATASETS_METADATA_DDL = """CREATE TABLE IF NOT EXISTS datasets_metadata (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT, datasets_type TEXT, severity TEXT, status TEXT, description TEXT, reported_by TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"""
+
+_IT_TICKETS_DDL = """CREATE TABLE IF NOT EXISTS tickets_table (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT, tickets_type TEXT, severity TEXT, status TEXT, description TEXT, reported_by TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"""
 
 
 def create_user_table(conn):
     """Create users table."""
     cursor = conn.cursor()
-    cursor.execute(
-        """CREATE TABLE IF NOT EXISTS datasets_metadata (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, description TEXT,created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""")
+    cursor.execute(_USERS_DDL)
     conn.commit()
 
 
 def create_cyber_incidents_table(conn):
     """Create cyber_incidents table."""
     cursor = conn.cursor()
-    cursor.execute(
-        """CREATE TABLE IF NOT EXISTS cyber_incidents (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT , incident_type, severity TEXT, status TEXT, description TEXT, reported_by TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""")
+    cursor.execute(_CYBER_INCIDENTS_DDL)
     conn.commit()
 
 
 def create_datasets_metadata_table(conn):
     """Create datasets_metadata table."""
     cursor = conn.cursor()
-    cursor.execute(
-        """CREATE TABLE IF NOT EXISTS datasets_metadata (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT , datasets_type,severity TEXT, status TEXT, description TEXT, reported_by TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""")
+    cursor.execute(_DATASETS_METADATA_DDL)
     conn.commit()
 
 
 def create_it_tickets_table(conn):
     """Create it_tickets table."""
     cursor = conn.cursor()
-    cursor.execute(
-        """CREATE TABLE IF NOT EXISTS tickets_table (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT, tickets_type,severity TEXT, status TEXT, description TEXT, reported_by TEXT,created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""")
+    cursor.execute(_IT_TICKETS_DDL)
     conn.commit()
 
 
 def create_all_tables(conn):
-    """Create all tables."""
-    create_user_table(conn)
-    create_cyber_incidents_table(conn)
-    create_datasets_metadata_table(conn)
-    create_it_tickets_table(conn)
\ No newline at end of file
+    """Create all tables in one executescript call (single parse round-trip)."""
+    with conn:
+        conn.executescript(";\n".join(
+            [_USERS_DDL, _CYBER_INCIDENTS_DDL, _DATASETS_METADATA_DDL, _IT_TICKETS_DDL]
+        ))
@@ -1,6 +1,7 @@
-import os 
+import os
 import sys
-import streamlit as st 
+import uuid
+import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime 
@@ -42,19 +43,132 @@ if st.button("Log out"):
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, os.pardir, os.pardir))
 
-# This is often needed for Streamlit app structures to find internal modules
-if project_root not in sys.path:
-    sys.path.append(project_root)
+@st.cache_resource(show_spinner=False)
+def _load_crud_modules():
+    """Resolves sys.path and imports the CRUD modules once per process.
+
+    Streamlit re-executes this script on every widget interaction, so the
+    path fix-up and try/except import are cached instead of re-run each time.
+    Returns (incidents_crud, connect_database), both None if unavailable.
+    """
+    # This is often needed for Streamlit app structures to find internal modules
+    if project_root not in sys.path:
+        sys.path.append(project_root)
+    try:
+        # Changed 'datasets_crud' to 'incidents_crud'
+        import app.data.incidents as incidents_crud
+        from app.data.db import connect_database
+        return incidents_crud, connect_database
+    except Exception:
+        return None, None
+
 
-# Attempt to import an external CRUD module (if it exists)
-try:
-    # Changed 'datasets_crud' to 'incidents_crud'
-    import app.data.incidents as incidents_crud 
+incidents_crud, connect_database = _load_crud_modules()
+if connect_database is not None:
     st.sidebar.success("External CRUD module loaded successfully.")
-except Exception:
+else:
     st.sidebar.caption("CRUD functionality is simulated in memory for this demo.")
 
 
+# --- SQLITE PERSISTENCE ---
+
+INCIDENTS_DDL = """CREATE TABLE IF NOT EXISTS incidents (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    severity TEXT,
+    status TEXT,
+    timestamp TEXT)"""
+
+
+def ensure_incidents_table():
+    """Creates the incidents table (and its filter index) if missing."""
+    if connect_database is None:
+        return False
+    try:
+        conn = connect_database()
+        with conn:
+            conn.execute(INCIDENTS_DDL)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_incidents_severity_status ON incidents(severity, status)")
+        conn.close()
+        return True
+    except Exception:
+        return False
+
+
+DB_AVAILABLE = ensure_incidents_table()
+
+
+def persist_incident_change(sql, params):
+    """Mirrors an in-memory CRUD change into the shared SQLite database.
+
+    Connections are WAL-mode (see app.data.db), so readers in other
+    sessions are never blocked by these single-row writes.
+    """
+    if not DB_AVAILABLE:
+        return
+    try:
+        conn = connect_database()
+        with conn:
+            conn.execute(sql, params)
+        conn.close()
+    except Exception as e:
+        st.sidebar.caption(f"DB persistence skipped: {e}")
+
+
+def seed_incidents_table(incidents_df):
+    """One-time bulk seed of the incidents table from the CSV frame.
+
+    Runs as a single executemany transaction (one commit, not one per
+    row) via app.data.db.bulk_insert.
+    """
+    if not DB_AVAILABLE or incidents_df.empty or 'id' not in incidents_df.columns:
+        return
+    try:
+        from app.data.db import bulk_insert
+
+        def col(name, fallback):
+            if name in incidents_df.columns:
+                return incidents_df[name]
+            if fallback in incidents_df.columns:
+                return incidents_df[fallback]
+            return pd.Series([''] * len(incidents_df), index=incidents_df.index)
+
+        # The CSV carries incident_type/created_at where the CRUD forms
+        # use title/timestamp, so fall back accordingly
+        rows = list(zip(
+            incidents_df['id'].astype(int).tolist(),
+            col('title', 'incident_type').astype(str).tolist(),
+            col('severity', 'severity').astype(str).tolist(),
+            col('status', 'status').astype(str).tolist(),
+            col('timestamp', 'created_at').astype(str).tolist(),
+        ))
+        conn = connect_database()
+        bulk_insert(conn, "INSERT OR IGNORE INTO incidents (id, title, severity, status, timestamp) VALUES (?, ?, ?, ?, ?)", rows)
+        conn.close()
+    except Exception as e:
+        st.sidebar.caption(f"DB seeding skipped: {e}")
+
+
+def load_incidents_from_db():
+    """Loads persisted incidents from SQLite; None if unavailable or empty."""
+    if not DB_AVAILABLE:
+        return None
+    try:
+        conn = connect_database()
+        db_df = pd.read_sql_query(
+            "SELECT id, title, severity, status, timestamp FROM incidents ORDER BY id", conn
+        )
+        conn.close()
+        if db_df.empty:
+            return None
+        db_df['timestamp'] = pd.to_datetime(db_df['timestamp'], errors='coerce', utc=True)
+        db_df = db_df.set_index('id', drop=False)
+        db_df.index.name = None
+        return db_df
+    except Exception:
+        return None
+
+
 # --- CSV FILE PATH DEFINITION ---
 
 def get_data_path(filename):
@@ -63,21 +177,109 @@ def get_data_path(filename):
 
 CSV_FILE_PATH = get_data_path("cyber_incidents_1000.csv")
 
+# Fixed vocabularies for the two label columns. Stored as Categorical,
+# each cell is a small integer code instead of a Python string, which
+# shrinks the columns ~10x and makes == and value_counts integer work.
+# The status list covers both the CSV values and the form options.
+SEVERITY_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Critical'], ordered=True)
+STATUS_DTYPE = pd.CategoricalDtype(['Open', 'Investigating', 'Mitigating', 'In Progress', 'Resolved', 'Closed'])
+
+# Chart styling, built once at import instead of on every render
+_SEVERITY_COLORS = px.colors.sequential.Plasma_r
+_STATUS_COLORS = {'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'}
+
+
+def _apply_column_dtypes(df):
+    """Casts the columns to their compact dtypes in place.
+
+    severity/status become fixed Categoricals, id drops from int64 to
+    int32, and title moves off Python objects onto pandas' Arrow-backed
+    string array (one contiguous UTF-8 buffer instead of a heap object
+    per cell).
+    """
+    if 'severity' in df.columns:
+        df['severity'] = df['severity'].astype(SEVERITY_DTYPE)
+    if 'status' in df.columns:
+        df['status'] = df['status'].astype(STATUS_DTYPE)
+    if 'id' in df.columns:
+        df['id'] = df['id'].astype('int32')
+    if 'title' in df.columns:
+        df['title'] = df['title'].astype('string')
+    return df
+
 
 # --- DATA LOADING AND SESSION STATE INITIALIZATION ---
 
-@st.cache_data
+def ensure_parquet(csv_path):
+    """Converts the CSV to Parquet once, refreshing only when the CSV is newer."""
+    parquet_path = csv_path.rsplit('.', 1)[0] + '.parquet'
+    try:
+        if (not os.path.exists(parquet_path)
+                or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+            # Arrow's multithreaded reader parses the columns (including the
+            # timestamps) in one pass, so no separate to_datetime step
+            incidents_df = pd.read_csv(csv_path, engine='pyarrow')
+            incidents_df.columns = incidents_df.columns.str.lower()
+            
+            incidents_df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        return parquet_path
+    except Exception:
+        # Fall back to the plain CSV path (e.g. pyarrow missing)
+        return None
+
+
+@st.cache_resource(show_spinner=False)
 def load_initial_incidents():
-    """Reads data from the CSV file for initial state, or creates dummy data on fail."""
+    """Reads data from the Parquet cache (or CSV fallback), or creates dummy data on fail.
+
+    Cached as a shared read-only resource: cache_resource hands back the
+    same object without pickling/hashing the frame on every access, so
+    callers that mutate must take a copy.
+    """
     try:
-        incidents_df = pd.read_csv(CSV_FILE_PATH, index_col=False)
-        incidents_df.columns = incidents_df.columns.str.lower()
+        # Prefer the shared SQLite store once it holds data, so every
+        # session sees the same persisted incidents
+        db_df = load_incidents_from_db()
+        if db_df is not None:
+            st.sidebar.success(f"Initial load: {len(db_df)} incidents from database.")
+            return _apply_column_dtypes(db_df)
+        
+        # The page only uses these five fields; description/reported_by/date
+        # are never rendered, so they are not worth parsing or holding
+        wanted = ['id', 'incident_type', 'severity', 'status', 'created_at']
+
+        parquet_path = ensure_parquet(CSV_FILE_PATH)
+        if parquet_path is not None:
+            # Columnar, typed read - no tokenizing, no dtype inference,
+            # and only the columns we ask for leave the file
+            incidents_df = pd.read_parquet(parquet_path, engine='pyarrow', columns=wanted)
+        else:
+            incidents_df = pd.read_csv(
+                CSV_FILE_PATH,
+                usecols=wanted,
+                dtype={'id': 'int32', 'incident_type': 'string',
+                       'severity': 'category', 'status': 'category'},
+                parse_dates=['created_at'],
+                cache_dates=True,
+            )
+
+        # The CSV header says incident_type/created_at; the rest of the
+        # page (forms, DB mirror) talks about title/timestamp
+        incidents_df = incidents_df.rename(columns={'incident_type': 'title', 'created_at': 'timestamp'})
+        incidents_df['timestamp'] = pd.to_datetime(incidents_df['timestamp'], errors='coerce', utc=True)
+        
+        # First run against an empty database: seed it from the CSV so
+        # later sessions load from SQLite directly
+        seed_incidents_table(incidents_df)
         
-        if 'timestamp' in incidents_df.columns:
-            incidents_df['timestamp'] = pd.to_datetime(incidents_df['timestamp'], errors='coerce')
+        # Hash-indexed by id (kept as a column too, for display) so CRUD
+        # lookups are O(1) instead of a full boolean scan
+        if 'id' in incidents_df.columns:
+            incidents_df = incidents_df.set_index('id', drop=False)
+            incidents_df.index.name = None
         
         st.sidebar.success(f"Initial load: {len(incidents_df)} incidents from CSV.")
-        return incidents_df
+        return _apply_column_dtypes(incidents_df)
         
     except FileNotFoundError:
         st.sidebar.error(f"Error: CSV file not found at '{CSV_FILE_PATH}'. Running on MOCK data.")
@@ -92,14 +294,80 @@ def load_initial_incidents():
                 datetime(2025, 11, 15), datetime(2025, 11, 29), datetime(2025, 11, 22)
             ]
         }
-        return pd.DataFrame(data)
+        mock_df = pd.DataFrame(data)
+        mock_df['timestamp'] = pd.to_datetime(mock_df['timestamp'], utc=True)
+        mock_df = mock_df.set_index('id', drop=False)
+        mock_df.index.name = None
+        return _apply_column_dtypes(mock_df)
     except Exception as e:
         st.error(f"Error reading CSV file: {e}")
         return pd.DataFrame()
 
 # Initialize the DataFrame in Streamlit's session state if it doesn't exist
 if 'incidents_df' not in st.session_state:
-    st.session_state['incidents_df'] = load_initial_incidents()
+    # Copy so in-memory CRUD never mutates the shared cached frame
+    st.session_state['incidents_df'] = load_initial_incidents().copy()
+
+# Revision counter: bumped on every mutation so cached aggregates expire
+if 'incidents_rev' not in st.session_state:
+    st.session_state['incidents_rev'] = 0
+
+# The cache_data pools below are shared by every session in the process,
+# but each session mutates its own copy of the frame - a session token
+# in the key keeps one user's edits out of another user's tables
+if '_session_token' not in st.session_state:
+    st.session_state['_session_token'] = uuid.uuid4().hex
+
+
+def _frame_fingerprint(df):
+    """Cheap cache key for this session's frame: (session, rows, max id, revision)."""
+    max_id = int(df['id'].max()) if 'id' in df.columns and len(df) else 0
+    return (st.session_state['_session_token'], len(df), max_id,
+            st.session_state['incidents_rev'])
+
+
+@st.cache_data(show_spinner=False)
+def _dashboard_aggregates(fingerprint, _df):
+    """Counts and the timestamp-sorted view, recomputed only when the frame changes.
+
+    _df is underscore-prefixed so Streamlit keys the cache on the cheap
+    fingerprint instead of hashing the whole DataFrame.
+    """
+    severity_counts = _df['severity'].value_counts() if 'severity' in _df.columns else pd.Series(dtype=int)
+    status_counts = _df['status'].value_counts() if 'status' in _df.columns else pd.Series(dtype=int)
+    sorted_df = _df.sort_values(by='timestamp', ascending=False) if 'timestamp' in _df.columns else _df
+    return severity_counts, status_counts, sorted_df
+
+
+@st.cache_data(show_spinner=False)
+def _sorted_ids(fingerprint, _df):
+    """Sorted id list for the Update/Delete pickers, reused across reruns."""
+    return _df['id'].sort_values().tolist()
+
+
+@st.cache_data(show_spinner=False)
+def _severity_pie(counts_df):
+    """Severity pie figure, rebuilt only when the counts change."""
+    return px.pie(
+        counts_df,
+        values='Count',
+        names='Severity',
+        title='Incidents by Severity',
+        color_discrete_sequence=_SEVERITY_COLORS
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _status_bar(counts_df):
+    """Status bar figure, rebuilt only when the counts change."""
+    return px.bar(
+        counts_df,
+        x='Status',
+        y='Count',
+        title='Incidents by Status',
+        color='Status',
+        color_discrete_map=_STATUS_COLORS,
+    )
 
 # --- HELPER FUNCTION FOR DATA MANAGEMENT FORMS ---
 def get_incident_row(df, incident_id):
@@ -107,10 +375,9 @@ def get_incident_row(df, incident_id):
     if incident_id is None:
         return None
     
-    filtered_df = df[df['id'] == incident_id]
-    
-    if not filtered_df.empty:
-        return filtered_df.iloc[0]
+    # The frame is indexed by id, so this is a hash lookup, not a scan
+    if incident_id in df.index:
+        return df.loc[incident_id]
     return None
 
 # --- CRUD FUNCTIONALITY (Operating on session state in memory) ---
@@ -122,17 +389,29 @@ def handle_add_incident(new_data):
     # Calculate a new unique ID
     new_id = current_df['id'].max() + 1 if not current_df.empty and 'id' in current_df.columns else 1000
     
-    new_row = pd.DataFrame([{
+    # UTC-aware, matching the datetime64[ns, UTC] column dtype: a naive
+    # datetime here would knock the column back to object
+    now = pd.Timestamp.now('UTC')
+
+    # In-place row append on the id index - no full-frame copy per add.
+    # The dashboard sorts by timestamp for display, so the new incident
+    # still shows at the top even though it lands at the bottom here.
+    current_df.loc[new_id] = {
         'id': new_id,
         'title': new_data['title'],
         'severity': new_data['severity'],
         'status': 'Open',
-        'timestamp': datetime.now(),
-    }])
-    
-    # Use pd.concat for reliable DataFrame appending, placing new incident at the top
-    st.session_state['incidents_df'] = pd.concat([new_row, current_df], ignore_index=True)
-    st.success(f"Incident '{new_data['title']}' added successfully (in memory). ID: {new_id}")
+        'timestamp': now,
+    }
+    # Row enlargement upcasts the compact dtypes (Categorical labels,
+    # int32 id, Arrow strings), so put them back
+    _apply_column_dtypes(current_df)
+    st.session_state['incidents_rev'] += 1
+    persist_incident_change(
+        "INSERT OR REPLACE INTO incidents (id, title, severity, status, timestamp) VALUES (?, ?, ?, ?, ?)",
+        (int(new_id), new_data['title'], new_data['severity'], 'Open', str(now))
+    )
+    st.success(f"Incident '{new_data['title']}' added successfully. ID: {new_id}")
 
 def handle_update_incident(incident_id, updated_data):
     """Handles the 'Update' operation."""
@@ -141,14 +420,17 @@ def handle_update_incident(incident_id, updated_data):
         st.error("Cannot update: 'id' column is missing.")
         return
 
-    # Find the index of the row to update
-    idx_to_update = current_df[current_df['id'] == incident_id].index
-    
-    if not idx_to_update.empty:
-        # Update fields in the session state DataFrame using .loc
+    if incident_id in current_df.index:
+        # Single indexed assignment instead of a boolean scan per field
         for key, value in updated_data.items():
-            st.session_state['incidents_df'].loc[idx_to_update, key] = value
-        st.success(f"Incident ID {incident_id} updated successfully (in memory).")
+            st.session_state['incidents_df'].loc[incident_id, key] = value
+        st.session_state['incidents_rev'] += 1
+        persist_incident_change(
+            "UPDATE incidents SET title = ?, severity = ?, status = ? WHERE id = ?",
+            (updated_data.get('title'), updated_data.get('severity'),
+             updated_data.get('status'), int(incident_id))
+        )
+        st.success(f"Incident ID {incident_id} updated successfully.")
     else:
         st.error(f"Incident ID {incident_id} not found for update.")
 
@@ -159,14 +441,12 @@ def handle_delete_incident(incident_id):
         st.error("Cannot delete: 'id' column is missing.")
         return
 
-    # Filter out the row with the given ID
-    rows_before = len(current_df)
-    st.session_state['incidents_df'] = current_df[current_df['id'] != incident_id].reset_index(drop=True)
-    
-    rows_after = len(st.session_state['incidents_df'])
-
-    if rows_before > rows_after:
-        st.success(f"Incident ID {incident_id} deleted successfully (in memory).")
+    if incident_id in current_df.index:
+        # Drop by index label - no boolean mask, no full-frame copy
+        current_df.drop(index=incident_id, inplace=True)
+        st.session_state['incidents_rev'] += 1
+        persist_incident_change("DELETE FROM incidents WHERE id = ?", (int(incident_id),))
+        st.success(f"Incident ID {incident_id} deleted successfully.")
     else:
         st.error(f"Incident ID {incident_id} not found for deletion.")
 
@@ -182,10 +462,14 @@ def display_dashboard(df):
         return
         
     col1, col2, col3 = st.columns(3)
-    
+
+    sev_counts, stat_counts, sorted_df = _dashboard_aggregates(_frame_fingerprint(df), df)
+
+    # The metrics come out of the same value_counts the charts use, so the
+    # status/severity columns are only scanned once each
     total_incidents = len(df)
-    open_incidents = df[df['status'] == 'Open'].shape[0] if 'status' in df.columns else 0
-    critical_incidents = df[df['severity'] == 'Critical'].shape[0] if 'severity' in df.columns else 0
+    open_incidents = int(stat_counts.get('Open', 0))
+    critical_incidents = int(sev_counts.get('Critical', 0))
 
     col1.metric("Total Incidents", total_incidents)
     col2.metric("Open Incidents", open_incidents)
@@ -196,38 +480,22 @@ def display_dashboard(df):
     st.header("Incident Analysis")
     chart_col1, chart_col2 = st.columns(2)
 
+    # The count frames are a handful of rows, so they are cheap for the
+    # figure caches to hash; the Plotly JSON is only rebuilt on real changes
     if 'severity' in df.columns:
-        severity_counts = df['severity'].value_counts().reset_index()
+        severity_counts = sev_counts.reset_index()
         severity_counts.columns = ['Severity', 'Count']
-        fig_severity = px.pie(
-            severity_counts, 
-            values='Count', 
-            names='Severity', 
-            title='Incidents by Severity',
-            color_discrete_sequence=px.colors.sequential.Plasma_r
-        )
-        chart_col1.plotly_chart(fig_severity, use_container_width=True)
+        chart_col1.plotly_chart(_severity_pie(severity_counts), use_container_width=True)
 
     if 'status' in df.columns:
-        status_counts = df['status'].value_counts().reset_index()
+        status_counts = stat_counts.reset_index()
         status_counts.columns = ['Status', 'Count']
-        fig_status = px.bar(
-            status_counts, 
-            x='Status', 
-            y='Count', 
-            title='Incidents by Status',
-            color='Status',
-            color_discrete_map={'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'},
-        )
-        chart_col2.plotly_chart(fig_status, use_container_width=True)
+        chart_col2.plotly_chart(_status_bar(status_counts), use_container_width=True)
 
     st.markdown("---")
 
     st.header("All Incidents Data (Read)")
-    if 'timestamp' in df.columns:
-        df = df.sort_values(by='timestamp', ascending=False)
-        
-    st.dataframe(df, use_container_width=True, height=350)
+    st.dataframe(sorted_df, use_container_width=True, height=350)
 
 
 def display_crud_form(df):
@@ -264,7 +532,7 @@ def display_crud_form(df):
         if can_manage and not df.empty:
             st.subheader("Update Incident Details")
             
-            incident_ids = df['id'].sort_values().tolist()
+            incident_ids = _sorted_ids(_frame_fingerprint(df), df)
             
             # Select the ID to update
             selected_update_id = st.selectbox("Select Incident ID to Update", incident_ids, key='update_id_select')
@@ -319,7 +587,7 @@ def display_crud_form(df):
         if can_manage and not df.empty:
             st.subheader("Delete Incident")
             
-            delete_ids = df['id'].sort_values().tolist()
+            delete_ids = _sorted_ids(_frame_fingerprint(df), df)
             
             # Select the ID to delete
             selected_delete_id = st.selectbox("Select Incident ID to Delete", delete_ids, key='delete_id_select')
@@ -373,6 +641,22 @@ OPENAI_MODEL = "gpt-4.1-mini"
 MAX_RETRIES = 3
 SYSTEM_INSTRUCTION = "You are a Data Science Specialist"
 
+# Only the most recent turns go to the API; without a cap the payload
+# (and the token bill) grows with every message in the session
+HISTORY_WINDOW = 12
+
+
+@st.cache_resource
+def _openai_session():
+    """One pooled HTTPS session, reused across turns so each message skips
+    the TCP + TLS handshake to api.openai.com."""
+    session = requests.Session()
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Authorization': f'Bearer {API_KEY}'
+    })
+    return session
+
 # --- Security Check: Ensure User is Logged In ---
 # If the user hasn't logged in, they can't see the chat.
 if "logged_in" not in st.session_state or not st.session_state.logged_in:
@@ -391,24 +675,23 @@ if "messages" not in st.session_state:
 
 # --- API Call Logic ---
 def get_ai_response(prompt, history):
-    """Sends the user's prompt and chat history to the OpenAI API."""
+    """Streams the AI reply from the OpenAI API, yielding tokens as they arrive."""
     
-    # Format the Streamlit history into the structure the OpenAI API expects
+    # Format the Streamlit history into the structure the OpenAI API expects,
+    # keeping only the last HISTORY_WINDOW turns
     contents = []
     # Note: OpenAI uses 'assistant' for the model's role, which matches Streamlit, 
     # but the history messages need to be built explicitly.
-    for msg in history:
+    for msg in history[-HISTORY_WINDOW:]:
         # The history includes roles 'user' and 'assistant'
         contents.append({
             "role": msg["role"], 
             "content": msg["content"]
         })
-        
-    # Append the current user prompt
-    contents.append({
-        "role": "user", 
-        "content": prompt
-    })
+
+    # The caller appends the prompt to the history before calling us, so
+    # it is already the last entry — appending it again sent it twice
+    assert history[-1]["role"] == "user"
 
     # The payload structure for OpenAI is different from Gemini
     payload_data = {
@@ -416,44 +699,77 @@ def get_ai_response(prompt, history):
         "messages": [
             {"role": "system", "content": SYSTEM_INSTRUCTION},
             *contents # The full conversation history plus the system instruction
-        ]
+        ],
+        # Stream tokens back as they are generated instead of waiting
+        # for the whole completion before showing anything
+        "stream": True
     }
 
     # Use the requests library to communicate with the API
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(
-                OPENAI_API_URL, # *** CHANGED API URL HERE ***
-                headers={
-                    'Content-Type': 'application/json',
-                    'Authorization': f'Bearer {API_KEY}' # *** ADDED AUTHORIZATION HEADER ***
-                }, 
-                data=json.dumps(payload_data)
+            # Pooled session: keep-alive connection, headers set once,
+            # and json= lets requests encode the body itself
+            response = _openai_session().post(
+                OPENAI_API_URL,
+                json=payload_data,
+                timeout=30,
+                stream=True
             )
             response.raise_for_status() 
             
-            result = response.json()
-            
-            # Extract the generated text from the structured JSON response
-            # NOTE: OpenAI uses 'message.content' inside 'choices[0]'
-            generated_text = result.get('choices', [{}])[0].get('message', {}).get('content')
-            
-            return generated_text if generated_text else "I couldn't generate a clear response for that request."
+            # The streaming response is server-sent events: one JSON chunk
+            # per "data:" line, each carrying the next slice of the answer
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                line = line.decode('utf-8')
+                if not line.startswith('data:'):
+                    continue
+                chunk = line[len('data:'):].strip()
+                if chunk == '[DONE]':
+                    return
+                delta = json.loads(chunk).get('choices', [{}])[0].get('delta', {})
+                token = delta.get('content')
+                if token:
+                    yield token
+            return
             
-        except requests.exceptions.RequestException as e:
+        except requests.exceptions.HTTPError:
+            status = response.status_code
             # Check for specific authentication errors (e.g., 401 Unauthorized)
-            if response.status_code == 401:
-                return "Authentication Error: The API Key is invalid or expired. Please check your key."
-            
+            if status == 401:
+                yield "Authentication Error: The API Key is invalid or expired. Please check your key."
+                return
+            # Other 4xx (bad request, model not found, ...) will fail the
+            # same way every time - retrying only burns the backoff time
+            if status < 500 and status != 429:
+                yield f"The API rejected the request (HTTP {status}). Check the model name and payload."
+                return
+            # 429 and 5xx are transient; the server may say how long to
+            # wait, but Retry-After can also be an HTTP-date, so fall
+            # back to plain backoff unless it is a plain integer
+            if attempt < MAX_RETRIES - 1:
+                try:
+                    wait_time = int(response.headers.get('Retry-After', ''))
+                except ValueError:
+                    wait_time = 2 ** attempt
+                time.sleep(wait_time)
+            else:
+                yield "Failed to get a response after several tries. Check your connection or API status."
+                return
+        except requests.exceptions.RequestException as e:
             st.error(f"Connection Error: {e}")
             if attempt < MAX_RETRIES - 1:
                 wait_time = 2 ** attempt
                 time.sleep(wait_time) 
             else:
-                return "Failed to get a response after several tries. Check your connection or API status."
+                yield "Failed to get a response after several tries. Check your connection or API status."
+                return
         except Exception as e:
             st.error(f"An unexpected error occurred: {e}")
-            return "An internal error occurred."
+            yield "An internal error occurred."
+            return
 
 
 # --- Display Chat History ---
@@ -468,12 +784,11 @@ if prompt := st.chat_input("Ask me a coding question..."):
     with st.chat_message("user"):
         st.markdown(prompt)
 
-    # 2. Get AI response and display it
+    # 2. Stream the AI response into the chat as the tokens arrive
     with st.chat_message("assistant"):
-        with st.spinner("AI is thinking..."):
-            # Send the prompt and the history 
-            assistant_response = get_ai_response(prompt, st.session_state.messages) 
-            st.markdown(assistant_response)
+        assistant_response = st.write_stream(
+            get_ai_response(prompt, st.session_state.messages)
+        )
 
     # 3. Add AI response to session state
     st.session_state.messages.append({"role": "assistant", "content": assistant_response})
\ No newline at end of file
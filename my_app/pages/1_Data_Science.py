@@ -1,9 +1,9 @@
-import os 
+import os
 import sys
-import streamlit as st 
+import uuid
+import streamlit as st
 import pandas as pd
-import plotly.express as px
-from datetime import datetime 
+import numpy as np
 from openai import OpenAI
 import requests
 import json
@@ -21,12 +21,58 @@ if project_root not in sys.path:
 
 try:
     import app.data.datasets as datasets_crud 
+    from app.data.db import connect_database
     st.sidebar.success("CRUD module loaded successfully.")
 except Exception as e:
     # If this fails, the app still runs on CSV data, but CRUD won't work
+    connect_database = None
     st.sidebar.error(f"Failed to import CRUD module: {e}")
 
 
+# --- SQLITE PERSISTENCE ---
+
+DATASETS_DDL = """CREATE TABLE IF NOT EXISTS datasets (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    severity TEXT,
+    status TEXT,
+    timestamp TEXT)"""
+
+
+def ensure_datasets_table():
+    """Creates the datasets table once; False when the DB layer is unavailable."""
+    if connect_database is None:
+        return False
+    try:
+        conn = connect_database()
+        with conn:
+            conn.execute(DATASETS_DDL)
+        conn.close()
+        return True
+    except Exception:
+        return False
+
+
+DB_AVAILABLE = ensure_datasets_table()
+
+
+def persist_dataset_change(sql, params):
+    """Mirrors one CRUD mutation into SQLite; silently degrades to memory-only.
+
+    Single-row INSERT/UPDATE/DELETE statements are constant-time on the
+    engine side, so persistence never scales with the frame size.
+    """
+    if not DB_AVAILABLE:
+        return
+    try:
+        conn = connect_database()
+        with conn:
+            conn.execute(sql, params)
+        conn.close()
+    except Exception as e:
+        st.sidebar.caption(f"DB persistence skipped: {e}")
+
+
 # Ensure state keys exist (in case user opens this page first)
 if "logged_in" not in st.session_state:
     st.session_state.logged_in = False
@@ -66,33 +112,117 @@ CSV_FILE_PATH = get_data_path("datasets_metadata_1000.csv")
 
 # --- DATA LOADING AND SESSION STATE INITIALIZATION ---
 
+# Fixed vocabularies for the label columns: as Categoricals they are
+# stored as small integer codes, so comparisons and value_counts run on
+# ints instead of Python strings. The status list covers both the CSV
+# values and the form options.
+SEVERITY_CATEGORIES = ['Low', 'Medium', 'High', 'Critical']
+STATUS_CATEGORIES = ['Open', 'Processing', 'In Progress', 'Completed', 'Failed', 'Closed']
+
+# Form select options and their precomputed positions: a dict lookup
+# replaces the list.index scan when preselecting the current value
+SEVERITY_OPTIONS = ['Low', 'Medium', 'High', 'Critical']
+STATUS_OPTIONS = ['Open', 'In Progress', 'Closed']
+SEVERITY_IDX = {v: i for i, v in enumerate(SEVERITY_OPTIONS)}
+STATUS_IDX = {v: i for i, v in enumerate(STATUS_OPTIONS)}
+
+STATUS_COLORS = {'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'}
+
+
+def _apply_category_dtypes(df):
+    """Casts severity/status to their fixed Categorical vocabularies."""
+    for c, cats in (('severity', SEVERITY_CATEGORIES), ('status', STATUS_CATEGORIES)):
+        if c in df.columns:
+            df[c] = pd.Categorical(df[c], categories=cats)
+    return df
+
+
+def _final_headers(csv_path):
+    """Peeks at the CSV header once and precomputes the final column names.
+
+    Lowercasing and the datasets_type/created_at -> title/timestamp rename
+    collapse into one lookup table built at import time, so each load does
+    a single columns assignment instead of two Index passes.
+    """
+    try:
+        with open(csv_path) as f:
+            raw_headers = f.readline().rstrip('\n').split(',')
+    except OSError:
+        return None
+    renames = {'datasets_type': 'title', 'created_at': 'timestamp'}
+    return [renames.get(h.lower(), h.lower()) for h in raw_headers]
+
+
+FINAL_HEADERS = _final_headers(CSV_FILE_PATH)
+
+
+def _read_and_normalize_csv(csv_path):
+    """One typed pass over the CSV via Arrow's multithreaded reader."""
+    datasets_df = pd.read_csv(csv_path, engine='pyarrow')
+    if FINAL_HEADERS is not None and len(FINAL_HEADERS) == len(datasets_df.columns):
+        datasets_df.columns = FINAL_HEADERS
+    else:
+        datasets_df.columns = datasets_df.columns.str.lower()
+        datasets_df = datasets_df.rename(columns={'datasets_type': 'title', 'created_at': 'timestamp'})
+    return datasets_df
+
+
+def ensure_parquet(csv_path):
+    """Converts the CSV to Parquet once, refreshing only when the CSV is newer.
+
+    Column normalization happens at conversion time, so every later start
+    reads an already-typed, already-renamed columnar file.
+    """
+    parquet_path = csv_path.rsplit('.', 1)[0] + '.parquet'
+    try:
+        if (not os.path.exists(parquet_path)
+                or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+            _read_and_normalize_csv(csv_path).to_parquet(
+                parquet_path, engine='pyarrow', compression='zstd')
+        return parquet_path
+    except Exception:
+        # Fall back to the plain CSV path (e.g. pyarrow missing)
+        return None
+
+
 @st.cache_data
 def load_initial_datasets():
-    """Reads data from the CSV file for initial state, or creates dummy data on fail."""
+    """Reads data from the Parquet cache (or CSV fallback), or creates dummy data on fail."""
     try:
-        datasets_df = pd.read_csv(CSV_FILE_PATH, index_col=False)
-        datasets_df.columns = datasets_df.columns.str.lower()
-        
+        parquet_path = ensure_parquet(CSV_FILE_PATH)
+        if parquet_path is not None:
+            # Columnar, typed, dictionary-compressed - no text parsing at all
+            datasets_df = pd.read_parquet(parquet_path, engine='pyarrow')
+        else:
+            datasets_df = _read_and_normalize_csv(CSV_FILE_PATH)
+
+        _apply_category_dtypes(datasets_df)
+
+        # Sorted newest-first once here; mutations keep the invariant
+        # (new rows always carry a later timestamp and are prepended),
+        # so no render path ever has to sort again
         if 'timestamp' in datasets_df.columns:
-            datasets_df['timestamp'] = pd.to_datetime(datasets_df['timestamp'], errors='coerce')
+            datasets_df = datasets_df.sort_values(by='timestamp', ascending=False, ignore_index=True)
         
         st.sidebar.success(f"Initial load: {len(datasets_df)} datasets from CSV.")
         return datasets_df
         
     except FileNotFoundError:
         st.sidebar.error(f"Error: CSV file not found at '{CSV_FILE_PATH}'. Dashboard running on MOCK data.")
-        # Generate mock data if file is missing
-        data = {
-            'id': [101, 102, 103, 104, 105, 106],
-            'title': ["User Log", "Network Flow", "Email Headers", "Firewall Logs", "Endpoint Alerts", "Threat Intel"],
-            'severity': ["High", "Critical", "Medium", "Low", "Critical", "Medium"],
-            'status': ["Open", "In Progress", "Open", "Closed", "Open", "In Progress"],
-            'timestamp': [
-                datetime(2025, 11, 20), datetime(2025, 11, 25), datetime(2025, 11, 28),
-                datetime(2025, 11, 15), datetime(2025, 11, 29), datetime(2025, 11, 22)
-            ]
-        }
-        return pd.DataFrame(data)
+        # Generate mock data if file is missing. Every column arrives
+        # already typed, so pandas skips dtype inference entirely and the
+        # frame matches the Categorical/datetime64 layout of a real load
+        return pd.DataFrame({
+            'id': np.array([101, 102, 103, 104, 105, 106], dtype='int32'),
+            'title': pd.array(["User Log", "Network Flow", "Email Headers",
+                               "Firewall Logs", "Endpoint Alerts", "Threat Intel"], dtype='string'),
+            'severity': pd.Categorical(["High", "Critical", "Medium", "Low", "Critical", "Medium"],
+                                       categories=SEVERITY_CATEGORIES),
+            'status': pd.Categorical(["Open", "In Progress", "Open", "Closed", "Open", "In Progress"],
+                                     categories=STATUS_CATEGORIES),
+            'timestamp': np.array(['2025-11-20', '2025-11-25', '2025-11-28',
+                                   '2025-11-15', '2025-11-29', '2025-11-22'], dtype='datetime64[ns]'),
+        })
     except Exception as e:
         st.error(f"Error reading CSV file: {e}")
         return pd.DataFrame()
@@ -101,91 +231,248 @@ def load_initial_datasets():
 if 'datasets_df' not in st.session_state:
     st.session_state['datasets_df'] = load_initial_datasets()
 
+# Create operations buffer here and are folded into the frame in one
+# concat per render, instead of one O(N) concat per insert
+st.session_state.setdefault('_pending_adds', [])
+
+# Monotonic id counter, seeded once from the loaded frame: each Create is
+# a post-increment instead of an O(N) max() over the id column
+if '_next_id' not in st.session_state:
+    _df = st.session_state['datasets_df']
+    st.session_state['_next_id'] = (
+        int(_df['id'].max()) + 1 if 'id' in _df.columns and len(_df) else 1)
+
+
+def _rebuild_id_index(df):
+    """Rebuilds the id -> row-position map behind the O(1) CRUD lookups."""
+    if 'id' in df.columns:
+        st.session_state['_id_index'] = dict(zip(df['id'].tolist(), range(len(df))))
+    else:
+        st.session_state['_id_index'] = {}
+
+
+if '_id_index' not in st.session_state:
+    _rebuild_id_index(st.session_state['datasets_df'])
+
+
+def _flush_pending():
+    """Folds any buffered Create rows into the main frame, one concat total."""
+    pending = st.session_state['_pending_adds']
+    if pending:
+        # Reversed so the newest buffered row lands first, preserving the
+        # frame's newest-first order without a sort
+        new_rows = _apply_category_dtypes(pd.DataFrame(pending[::-1]))
+        st.session_state['datasets_df'] = pd.concat(
+            [new_rows, st.session_state['datasets_df']], ignore_index=True)
+        st.session_state['_pending_adds'] = []
+        _rebuild_id_index(st.session_state['datasets_df'])
+    return st.session_state['datasets_df']
+
+# Revision counter: bumped on in-place mutations (updates, deletes) that
+# the length/max-id part of the fingerprint would not notice
+st.session_state.setdefault('datasets_rev', 0)
+
+# cache_data is process-global while the frame is per-session, so the
+# fingerprint needs a session token - otherwise two sessions with equal
+# (rows, max id, rev) would read each other's aggregates and tables
+if '_session_token' not in st.session_state:
+    st.session_state['_session_token'] = uuid.uuid4().hex
+
+
+def _frame_fingerprint(df):
+    """Cheap cache key for this session's frame: (session, rows, max id, revision)."""
+    max_id = int(df['id'].max()) if 'id' in df.columns and len(df) else 0
+    return (st.session_state['_session_token'], len(df), max_id,
+            st.session_state['datasets_rev'])
+
+
+@st.cache_data(show_spinner=False)
+def _dashboard_aggregates(fingerprint, _df):
+    """Label counts, recomputed only when the frame changes.
+
+    _df is underscore-prefixed so Streamlit keys the cache on the cheap
+    fingerprint instead of hashing the whole DataFrame.
+    """
+    sev_vc = _df['severity'].value_counts() if 'severity' in _df.columns else pd.Series(dtype=int)
+    stat_vc = _df['status'].value_counts() if 'status' in _df.columns else pd.Series(dtype=int)
+    return sev_vc, stat_vc
+
+
+@st.cache_data(show_spinner=False)
+def _sorted_ids(fingerprint, _df):
+    """Sorted id list for the Update/Delete pickers, reused across reruns."""
+    return _df['id'].sort_values().tolist()
+
+
+@st.cache_resource(show_spinner=False)
+def _severity_pie(labels, values):
+    """Severity pie built straight from the label/count arrays.
+
+    go.Pie skips all the column-name resolution px.pie does over a
+    DataFrame, and the cache keys on the handful of counts, so the
+    figure is only rebuilt when they actually change.
+    """
+    # Imported here rather than at module top: Plotly's import graph is
+    # heavy and only the dashboard view draws charts (module imports are
+    # cached after the first hit)
+    import plotly.graph_objects as go
+    from plotly.colors import sequential
+    fig = go.Figure(go.Pie(labels=labels, values=values,
+                           marker_colors=sequential.Plasma_r))
+    fig.update_layout(title_text='Datasets by Severity')
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _status_bar(labels, values):
+    """Status bar built straight from the label/count arrays."""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(
+        x=labels, y=values,
+        marker_color=[STATUS_COLORS.get(l, '#6B7280') for l in labels]))
+    fig.update_layout(title_text='Datasets by Status',
+                      xaxis_title='Status', yaxis_title='Count')
+    return fig
+
+
 # --- HELPER FUNCTION FOR DATA MANAGEMENT FORMS ---
 def get_dataset_row(df, dataset_id):
     """Retrieves a single dataset row (Series) by ID, or None if not found."""
     if dataset_id is None:
         return None
     
-    filtered_df = df[df['id'] == dataset_id]
-    
-    if not filtered_df.empty:
-        # Return the first matching row as a Pandas Series
-        return filtered_df.iloc[0]
+    # Dict lookup into the id map instead of a boolean scan of the frame
+    pos = st.session_state['_id_index'].get(dataset_id)
+    if pos is not None:
+        return df.iloc[pos]
     return None
 
 # --- CRUD FUNCTIONALITY (Operating on session state for now) ---
 
+def _flash_success(msg):
+    """Queues a success message for the run after the next rerun.
+
+    Mutations trigger an app-scope st.rerun(), which discards the current
+    run's output - an st.success emitted here and now would never be seen.
+    """
+    st.session_state['_crud_flash'] = msg
+
+
 def handle_add_dataset(new_data):
-    """Handles the 'Create' operation."""
-    current_df = st.session_state['datasets_df']
-    
-    new_id = current_df['id'].max() + 1 if not current_df.empty and 'id' in current_df.columns else 1
-    
-    new_row = pd.DataFrame([{
+    """Handles the 'Create' operation by buffering the row until the next render."""
+    pending = st.session_state['_pending_adds']
+
+    # O(1) draw from the session counter - no column scan per insert
+    new_id = st.session_state['_next_id']
+    st.session_state['_next_id'] += 1
+
+    # Appending a dict to a list is O(1); _flush_pending folds everything
+    # buffered into the frame with a single concat on the next render
+    row = {
         'id': new_id,
         'title': new_data['title'],
         'severity': new_data['severity'],
         'status': 'Open',
-        'timestamp': datetime.now(),
-    }])
-    
-    # Use pd.concat for reliable DataFrame appending
-    st.session_state['datasets_df'] = pd.concat([new_row, current_df], ignore_index=True)
-    st.success(f"Dataset '{new_data['title']}' added successfully (in memory).")
+        # datetime64 rather than a boxed Python datetime, so the flush
+        # concat keeps the column as a plain int64-backed datetime64
+        # array instead of falling back to object dtype
+        'timestamp': np.datetime64('now', 'ns'),
+    }
+    pending.append(row)
+    persist_dataset_change(
+        "INSERT OR REPLACE INTO datasets (id, title, severity, status, timestamp) VALUES (?, ?, ?, ?, ?)",
+        (int(new_id), row['title'], row['severity'], row['status'], str(row['timestamp']))
+    )
+    _flash_success(f"Dataset '{new_data['title']}' added successfully.")
+    return True
 
 def handle_update_dataset(dataset_id, updated_data):
     """Handles the 'Update' operation."""
     current_df = st.session_state['datasets_df']
     if 'id' not in current_df.columns:
         st.error("Cannot update: 'id' column is missing.")
-        return
+        return False
 
-    # Find the index of the row to update
-    idx_to_update = current_df[current_df['id'] == dataset_id].index
+    # O(1) position lookup instead of scanning the id column
+    pos = st.session_state['_id_index'].get(dataset_id)
     
-    if not idx_to_update.empty:
-        # Update fields in the session state DataFrame using .loc
-        for key, value in updated_data.items():
-            st.session_state['datasets_df'].loc[idx_to_update, key] = value
-        st.success(f"Dataset ID {dataset_id} updated successfully (in memory).")
+    if pos is not None:
+        # One positional assignment for all fields - a single BlockManager
+        # write instead of an index alignment per key
+        col_positions = current_df.columns.get_indexer(list(updated_data))
+        current_df.iloc[pos, col_positions] = list(updated_data.values())
+        st.session_state['datasets_rev'] += 1
+        persist_dataset_change(
+            "UPDATE datasets SET title = ?, severity = ?, status = ? WHERE id = ?",
+            (updated_data.get('title'), updated_data.get('severity'),
+             updated_data.get('status'), int(dataset_id))
+        )
+        _flash_success(f"Dataset ID {dataset_id} updated successfully.")
+        return True
     else:
         st.error(f"Dataset ID {dataset_id} not found for update.")
+        return False
 
 def handle_delete_dataset(dataset_id):
     """Handles the 'Delete' operation."""
     current_df = st.session_state['datasets_df']
     if 'id' not in current_df.columns:
         st.error("Cannot delete: 'id' column is missing.")
-        return
-
-    # Filter out the row with the given ID
-    rows_before = len(current_df)
-    st.session_state['datasets_df'] = current_df[current_df['id'] != dataset_id].reset_index(drop=True)
-    
-    rows_after = len(st.session_state['datasets_df'])
-
-    if rows_before > rows_after:
-        st.success(f"Dataset ID {dataset_id} deleted successfully (in memory).")
+        return False
+
+    # O(1) existence check via the id map before touching the frame
+    pos = st.session_state['_id_index'].get(dataset_id)
+    if pos is not None:
+        # Single drop of the located label - no boolean mask over the id
+        # column and no reset_index copy afterwards
+        st.session_state['datasets_df'] = current_df.drop(index=current_df.index[pos])
+        _rebuild_id_index(st.session_state['datasets_df'])
+        st.session_state['datasets_rev'] += 1
+        persist_dataset_change("DELETE FROM datasets WHERE id = ?", (int(dataset_id),))
+        _flash_success(f"Dataset ID {dataset_id} deleted successfully.")
+        return True
     else:
         st.error(f"Dataset ID {dataset_id} not found for deletion.")
+        return False
 
 
 # --- STREAMLIT PAGE FUNCTIONS ---
 
+TABLE_PAGE_SIZE = 50
+
+
+def _paged_dataframe(df, key, height=350):
+    """Renders one page of rows instead of shipping the whole frame.
+
+    st.dataframe serializes everything it is given to Arrow on every
+    rerun, so slicing first caps that cost at TABLE_PAGE_SIZE rows no
+    matter how large the frame grows.
+    """
+    n_pages = max(1, -(-len(df) // TABLE_PAGE_SIZE))
+    page = st.number_input("Page", 1, n_pages, 1, key=key) if n_pages > 1 else 1
+    start = (page - 1) * TABLE_PAGE_SIZE
+    st.dataframe(df.iloc[start:start + TABLE_PAGE_SIZE],
+                 use_container_width=True, height=height)
+
 def display_dashboard(df):
     """Renders the main dashboard metrics and charts."""
     st.title("🛡️ Datasets Dashboard Overview")
 
+    df = _flush_pending()
+
     if df.empty:
         st.info("No datasets to display.")
         return
         
     col1, col2, col3 = st.columns(3)
-    
+
+    # Counts and the sorted view come from the fingerprint-keyed cache,
+    # so unchanged data costs a tuple compare instead of real work
+    sev_vc, stat_vc = _dashboard_aggregates(_frame_fingerprint(df), df)
+
     total_datasets = len(df)
-    open_datasets = df[df['status'] == 'Open'].shape[0] if 'status' in df.columns else 0
-    critical_datasets = df[df['severity'] == 'Critical'].shape[0] if 'severity' in df.columns else 0
+    open_datasets = int(stat_vc.get('Open', 0))
+    critical_datasets = int(sev_vc.get('Critical', 0))
 
     col1.metric("Total Datasets", total_datasets)
     col2.metric("Open Datasets", open_datasets)
@@ -194,156 +481,181 @@ def display_dashboard(df):
     st.markdown("---")
 
     st.header("Datasets Analysis")
+
     chart_col1, chart_col2 = st.columns(2)
 
+    # Figures are assembled from the two small count arrays directly -
+    # no intermediate counts DataFrame and no px column introspection
     if 'severity' in df.columns:
-        severity_counts = df['severity'].value_counts().reset_index()
-        severity_counts.columns = ['Severity', 'Count']
-        fig_severity = px.pie(
-            severity_counts, 
-            values='Count', 
-            names='Severity', 
-            title='Datasets by Severity',
-            color_discrete_sequence=px.colors.sequential.Plasma_r
-        )
-        chart_col1.plotly_chart(fig_severity, use_container_width=True)
+        chart_col1.plotly_chart(
+            _severity_pie(tuple(map(str, sev_vc.index)), tuple(map(int, sev_vc))),
+            use_container_width=True)
 
     if 'status' in df.columns:
-        status_counts = df['status'].value_counts().reset_index()
-        status_counts.columns = ['Status', 'Count']
-        fig_status = px.bar(
-            status_counts, 
-            x='Status', 
-            y='Count', 
-            title='Datasets by Status',
-            color='Status',
-            color_discrete_map={'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'},
-        )
-        chart_col2.plotly_chart(fig_status, use_container_width=True)
+        chart_col2.plotly_chart(
+            _status_bar(tuple(map(str, stat_vc.index)), tuple(map(int, stat_vc))),
+            use_container_width=True)
 
     st.markdown("---")
 
     st.header("All Datasets Data (R-ead)")
-    if 'timestamp' in df.columns:
-        df = df.sort_values(by='timestamp', ascending=False)
+    # Already newest-first by construction - see load/flush invariant
+    _paged_dataframe(df, key='dashboard_table_page')
+
+
+@st.fragment
+def _create_tab():
+    """Create form; widget interactions rerun only this fragment."""
+    st.subheader("Add New Dataset")
+    
+    with st.form("add_dataset_form", clear_on_submit=True):
+        
+        new_title = st.text_input("Dataset Title", max_chars=100)
+        new_severity = st.selectbox("Severity Level", SEVERITY_OPTIONS)
         
-    st.dataframe(df, use_container_width=True, height=350)
+        submitted = st.form_submit_button("Submit New Dataset")
+        
+        if submitted:
+            if new_title:
+                new_data = {
+                    'title': new_title,
+                    'severity': new_severity
+                }
+                if handle_add_dataset(new_data):
+                    # Full-app rerun: a fragment rerun alone would leave
+                    # the Live View and dashboard on pre-mutation data
+                    st.rerun()
+            else:
+                st.error("Please enter a title for the dataset.")
+
+
+def _manageable_ids(action):
+    """Shared guard for the Update/Delete fragments.
+
+    Computes the can-manage/non-empty check and the sorted id list once
+    per fragment run; when the frame is not manageable it renders the
+    single appropriate empty-state message and returns None, so the two
+    tabs no longer carry duplicated elif/else branches.
+    """
+    df = st.session_state['datasets_df']
+    if 'id' not in df.columns:
+        st.warning("Cannot manage data: 'id' column is missing in the initial dataset.")
+        return df, None
+    if df.empty:
+        st.info(f"No datasets available to {action}.")
+        return df, None
+    return df, _sorted_ids(_frame_fingerprint(df), df)
+
+
+@st.fragment
+def _update_tab():
+    """Update form; reads the live frame so fragment reruns never go stale."""
+    df, dataset_ids = _manageable_ids('update')
+    if dataset_ids is None:
+        return
+
+    st.subheader("Update Dataset Details")
+
+    default_index = 0 if dataset_ids else None
+
+    selected_update_id = st.selectbox("Select Dataset ID to Update", dataset_ids, index=default_index, key='update_id_select')
+
+    if selected_update_id is not None:
+        current_data = get_dataset_row(df, selected_update_id)
+
+        if current_data is not None:
+            with st.form("update_dataset_form"):
+                # Safely access fields using .get() to prevent KeyError
+                current_title = current_data.get('title', 'Title Missing')
+                current_severity = current_data.get('severity', 'Medium')
+                current_status = current_data.get('status', 'Open')
+
+                st.caption(f"Editing Dataset ID: **{selected_update_id}** - Current Title: **{current_title}**")
+
+                upd_title = st.text_input("New Title", value=current_title, max_chars=100)
+
+                upd_severity = st.selectbox(
+                    "New Severity Level",
+                    SEVERITY_OPTIONS,
+                    index=SEVERITY_IDX.get(current_severity, 0)
+                )
+                upd_status = st.selectbox(
+                    "New Status",
+                    STATUS_OPTIONS,
+                    index=STATUS_IDX.get(current_status, 0)
+                )
+
+                update_submitted = st.form_submit_button("Apply Update", type="primary")
+
+                if update_submitted:
+                    updated_data = {
+                        'title': upd_title,
+                        'severity': upd_severity,
+                        'status': upd_status
+                    }
+                    if handle_update_dataset(selected_update_id, updated_data):
+                        # Propagate beyond this fragment (see Create tab)
+                        st.rerun()
+        else:
+             st.info(f"Dataset ID {selected_update_id} not found in current data.")
+    else:
+        st.info("No datasets available to update.")
+
+
+@st.fragment
+def _delete_tab():
+    """Delete form; reads the live frame so fragment reruns never go stale."""
+    df, delete_ids = _manageable_ids('delete')
+    if delete_ids is None:
+        return
+
+    st.subheader("Delete Dataset")
+
+    default_delete_index = 0 if delete_ids else None
+
+    selected_delete_id = st.selectbox("Select Dataset ID to Delete", delete_ids, index=default_delete_index, key='delete_id_select')
+
+    if selected_delete_id is not None:
+        st.warning(f"Are you sure you want to delete Dataset ID: **{selected_delete_id}**? This cannot be undone.")
+
+        if st.button("Confirm Delete", type="primary"):
+            if handle_delete_dataset(selected_delete_id):
+                # Propagate beyond this fragment (see Create tab)
+                st.rerun()
+    else:
+        st.info("No dataset selected for deletion.")
 
 
 def display_crud_form(df):
-    """Renders the Add Dataset (Create), Update, and Delete forms using tabs."""
+    """Renders the Add Dataset (Create), Update, and Delete forms using tabs.
+
+    Each tab body is an st.fragment, so typing in one form reruns just
+    that fragment instead of re-executing the whole page (and its charts).
+    """
     st.title("🗂️ Dataset Management (Create, Read, Update, Delete)")
-    
-    can_manage = 'id' in df.columns
+
+    # Confirmation from the mutation that triggered this rerun, if any
+    if '_crud_flash' in st.session_state:
+        st.success(st.session_state.pop('_crud_flash'))
+
+    df = _flush_pending()
 
     create_tab, update_tab, delete_tab = st.tabs(["➕ Create New", "✏️ Update Existing", "🗑️ Delete Dataset"])
     
-    # --- CREATE TAB ---
     with create_tab:
-        st.subheader("Add New Dataset")
-        
-        with st.form("add_dataset_form", clear_on_submit=True):
-            
-            new_title = st.text_input("Dataset Title", max_chars=100)
-            new_severity = st.selectbox("Severity Level", ['Low', 'Medium', 'High', 'Critical'])
-            
-            submitted = st.form_submit_button("Submit New Dataset")
-            
-            if submitted:
-                if new_title:
-                    new_data = {
-                        'title': new_title,
-                        'severity': new_severity
-                    }
-                    handle_add_dataset(new_data)
-                else:
-                    st.error("Please enter a title for the dataset.")
+        _create_tab()
 
-    # --- UPDATE TAB ---
     with update_tab:
-        if can_manage and not df.empty:
-            st.subheader("Update Dataset Details")
-            
-            dataset_ids = df['id'].sort_values().tolist()
-            
-            default_index = 0 if dataset_ids else None 
-            
-            selected_update_id = st.selectbox("Select Dataset ID to Update", dataset_ids, index=default_index, key='update_id_select')
-            
-            if selected_update_id is not None:
-                current_data = get_dataset_row(df, selected_update_id)
-                
-                if current_data is not None:
-                    with st.form("update_dataset_form"):
-                        # Safely access fields using .get() to prevent KeyError
-                        current_title = current_data.get('title', 'Title Missing')
-                        current_severity = current_data.get('severity', 'Medium')
-                        current_status = current_data.get('status', 'Open')
-                        
-                        st.caption(f"Editing Dataset ID: **{selected_update_id}** - Current Title: **{current_title}**")
-                        
-                        upd_title = st.text_input("New Title", value=current_title, max_chars=100)
-                        
-                        severity_options = ['Low', 'Medium', 'High', 'Critical']
-                        status_options = ['Open', 'In Progress', 'Closed']
-                        
-                        upd_severity = st.selectbox(
-                            "New Severity Level", 
-                            severity_options, 
-                            index=severity_options.index(current_severity) if current_severity in severity_options else 0
-                        )
-                        upd_status = st.selectbox(
-                            "New Status", 
-                            status_options, 
-                            index=status_options.index(current_status) if current_status in status_options else 0
-                        )
-                        
-                        update_submitted = st.form_submit_button("Apply Update", type="primary")
-                        
-                        if update_submitted:
-                            updated_data = {
-                                'title': upd_title,
-                                'severity': upd_severity,
-                                'status': upd_status
-                            }
-                            handle_update_dataset(selected_update_id, updated_data)
-                else:
-                     st.info(f"Dataset ID {selected_update_id} not found in current data.")
-            else:
-                st.info("No datasets available to update.")
-        elif not can_manage:
-            st.warning("Cannot manage data: 'id' column is missing in the initial dataset.")
-        else:
-            st.info("No datasets available to update.")
+        _update_tab()
         
-    # --- DELETE TAB ---
     with delete_tab:
-        if can_manage and not df.empty:
-            st.subheader("Delete Dataset")
-            
-            delete_ids = df['id'].sort_values().tolist()
-            
-            default_delete_index = 0 if delete_ids else None 
-            
-            selected_delete_id = st.selectbox("Select Dataset ID to Delete", delete_ids, index=default_delete_index, key='delete_id_select')
-
-            if selected_delete_id is not None:
-                st.warning(f"Are you sure you want to delete Dataset ID: **{selected_delete_id}**? This cannot be undone.")
-
-                if st.button("Confirm Delete", type="primary"):
-                    handle_delete_dataset(selected_delete_id)
-            else:
-                st.info("No dataset selected for deletion.")
-        elif not can_manage:
-            st.warning("Cannot manage data: 'id' column is missing in the initial dataset.")
-        else:
-            st.info("No datasets available to delete.")
+        _delete_tab()
 
 
     st.markdown("---")
     
     st.subheader("Current Datasets List (Live View)")
-    st.dataframe(df, use_container_width=True)
+    _paged_dataframe(df, key='live_view_page')
 
 
 # --- MAIN APPLICATION LOGIC ---
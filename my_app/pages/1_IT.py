@@ -1,6 +1,7 @@
-import os 
+import os
 import sys
-import streamlit as st 
+import uuid
+import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime 
@@ -51,20 +52,90 @@ if st.button("Log out"):
 
 # --- Custom Function to Read Data from CSV ---
 
-@st.cache_data
-def get_tickets_from_csv():
-    """Reads data from the CSV file. If the file is not found, it creates dummy data."""
+# Fixed vocabularies covering both the CSV values and every form option.
+# Categories learned only from observed data would reject a value the
+# forms can legally submit (e.g. severity 'Critical') at assignment time.
+SEVERITY_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Critical'])
+STATUS_DTYPE = pd.CategoricalDtype(['Open', 'In Progress', 'Resolved', 'Closed'])
+
+
+def _apply_label_dtypes(df):
+    """Keeps severity/status on the fixed categoricals - integer-code
+    comparisons and a fraction of the memory of per-row Python strings."""
+    for col, dtype in (('severity', SEVERITY_DTYPE), ('status', STATUS_DTYPE)):
+        if col in df.columns and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def _index_by_id(df):
+    """Hash-indexes the frame by id (kept as a column too, for display).
+
+    Every CRUD handler then finds its row with a dict probe on the index
+    instead of a boolean scan over the whole id column.
+    """
+    if 'id' in df.columns:
+        df = df.set_index('id', drop=False)
+        df.index.name = None
+    return df
+
+
+@st.cache_resource
+def get_tickets_from_csv(csv_mtime):
+    """Reads data from the CSV file. If the file is not found, it creates dummy data.
+
+    csv_mtime is only a cache key: a changed file on disk produces a new
+    key and therefore a fresh parse, so the cache invalidates itself
+    without anyone having to clear it by hand.
+
+    cache_resource hands the same frame back by reference on every hit -
+    unlike cache_data it never pickles or hashes the return value, so a
+    cache hit is a dict lookup rather than an MD5 over the whole frame.
+    Callers that mutate must therefore take a copy.
+    """
     try:
-        # 1. Read the actual CSV file using the calculated path
-        tickets_df = pd.read_csv(CSV_FILE_PATH, index_col=False)
-        
-        # 2. Basic cleanup and type conversion 
+        # 0. Prefer the Parquet companion when it is at least as fresh as
+        #    the CSV: columnar and already typed, so a cold start skips
+        #    tokenizing and dtype work entirely
+        pq_path = CSV_FILE_PATH.rsplit('.', 1)[0] + '.parquet'
+        if (os.path.exists(pq_path)
+                and os.path.getmtime(pq_path) >= os.path.getmtime(CSV_FILE_PATH)):
+            tickets_df = pd.read_parquet(pq_path, engine='pyarrow')
+            st.sidebar.success(f"Loaded {len(tickets_df)} tickets from Parquet cache.")
+            # A companion written before the vocabularies grew may carry
+            # narrower categories; recast onto the fixed dtypes
+            return _index_by_id(_apply_label_dtypes(tickets_df))
+
+        # 1. Read the CSV in one typed pass: Arrow's multithreaded parser
+        #    plus an explicit schema, so no object-dtype inference happens
+        #    and the two low-cardinality label columns land as categoricals
+        tickets_df = pd.read_csv(
+            CSV_FILE_PATH,
+            engine='pyarrow',
+            dtype={'id': 'int32', 'tickets_type': 'string',
+                   'severity': SEVERITY_DTYPE, 'status': STATUS_DTYPE},
+            parse_dates=['created_at'],
+        )
+
+        # 2. The CSV header says tickets_type/created_at; the rest of the
+        #    page (forms, charts, tables) talks about title/timestamp
+        tickets_df = tickets_df.rename(columns={'tickets_type': 'title', 'created_at': 'timestamp'})
+
+        # Sort newest-first once at load. Mutations keep the order (adds
+        # prepend rows with later timestamps, updates never touch the
+        # timestamp), so the render path can skip sorting from then on
         if 'timestamp' in tickets_df.columns:
-            # Convert timestamp column to datetime objects
-            tickets_df['timestamp'] = pd.to_datetime(tickets_df['timestamp'], errors='coerce')
-        
+            tickets_df = tickets_df.sort_values(by='timestamp', ascending=False)
+
+        # 3. Write the Parquet companion back so the next cold start
+        #    takes the fast path above
+        try:
+            tickets_df.to_parquet(pq_path, engine='pyarrow', compression='zstd')
+        except Exception:
+            pass  # e.g. read-only data dir; the CSV parse already succeeded
+
         st.sidebar.success(f"Loaded {len(tickets_df)} tickets from CSV.")
-        return tickets_df
+        return _index_by_id(tickets_df)
         
     except FileNotFoundError:
         st.sidebar.error(f"Error: CSV file not found at '{CSV_FILE_PATH}'. Dashboard running on MOCK data.")
@@ -80,7 +151,7 @@ def get_tickets_from_csv():
                 datetime(2025, 11, 15), datetime(2025, 11, 29), datetime(2025, 11, 22)
             ]
         }
-        return pd.DataFrame(data)
+        return _index_by_id(_apply_label_dtypes(pd.DataFrame(data)))
     except Exception as e:
         st.error(f"Error reading CSV file. Check columns names (e.g., severity, status): {e}")
         return pd.DataFrame()
@@ -88,7 +159,111 @@ def get_tickets_from_csv():
 # --- INITIALIZATION (Use session state for CRUD) ---
 
 if 'tickets_df' not in st.session_state:
-    st.session_state['tickets_df'] = get_tickets_from_csv()
+    # Stat the CSV once per load; the mtime doubles as the cache key
+    try:
+        _csv_mtime = os.path.getmtime(CSV_FILE_PATH)
+    except OSError:
+        _csv_mtime = 0.0
+    # Copy so the CRUD handlers never mutate the shared cached frame
+    st.session_state['tickets_df'] = get_tickets_from_csv(_csv_mtime).copy()
+
+# Creates land here first; a render folds them all in with one concat
+# instead of copying the whole frame on every single add
+st.session_state.setdefault('pending_tickets', [])
+
+# Next ticket id, seeded once from the loaded frame; Creates increment it
+# rather than re-running an O(N) max() over the id column
+if 'next_id' not in st.session_state:
+    _df = st.session_state['tickets_df']
+    st.session_state['next_id'] = int(_df['id'].max()) + 1 if 'id' in _df.columns and len(_df) else 1000
+
+
+def _flush_pending_tickets():
+    """Materialises any buffered Create rows into the main frame."""
+    pending = st.session_state['pending_tickets']
+    if pending:
+        # Newest buffered ticket first, matching the old prepend order;
+        # the index labels stay the ids so lookups keep working
+        rows = pending[::-1]
+        new_rows = pd.DataFrame(rows, index=[r['id'] for r in rows])
+        # Concat demotes the label columns to object (the buffered dicts
+        # carry plain strings), so restore the categoricals afterwards
+        st.session_state['tickets_df'] = _apply_label_dtypes(
+            pd.concat([new_rows, st.session_state['tickets_df']]))
+        pending.clear()
+    return st.session_state['tickets_df']
+
+# Bumped by in-place mutations (updates, deletes) that the length/max-id
+# part of the fingerprint below would not notice
+st.session_state.setdefault('tickets_rev', 0)
+
+# Sessions share the process-global cache_data pools but each works on
+# its own copy of the frame; keying on a session token stops one user's
+# edits from surfacing in another user's dashboard
+if '_session_token' not in st.session_state:
+    st.session_state['_session_token'] = uuid.uuid4().hex
+
+
+def _frame_fingerprint(df):
+    """Cheap cache key for this session's frame: (session, rows, max id, revision)."""
+    max_id = int(df['id'].max()) if 'id' in df.columns and len(df) else 0
+    return (st.session_state['_session_token'], len(df), max_id,
+            st.session_state['tickets_rev'])
+
+
+@st.cache_data(show_spinner=False)
+def _dashboard_aggregates(fingerprint, _df):
+    """Chart counts and the timestamp-sorted view, keyed on the fingerprint.
+
+    _df carries the underscore prefix so Streamlit keys the cache on the
+    three-tuple fingerprint rather than hashing the whole frame; reruns
+    with unchanged data cost a tuple compare.
+    """
+    sev_counts = _df['severity'].value_counts() if 'severity' in _df.columns else pd.Series(dtype=int)
+    status_counts = _df['status'].value_counts() if 'status' in _df.columns else pd.Series(dtype=int)
+    # The frame is loaded newest-first and mutations preserve that, so
+    # the O(n) monotonic check almost always replaces the O(n log n) sort
+    if 'timestamp' in _df.columns and not _df['timestamp'].is_monotonic_decreasing:
+        sorted_df = _df.sort_values(by='timestamp', ascending=False)
+    else:
+        sorted_df = _df
+    return sev_counts, status_counts, sorted_df
+
+
+@st.cache_data(show_spinner=False)
+def _sorted_ticket_ids(fingerprint, _df):
+    """Sorted id list shared by the Update and Delete pickers."""
+    return _df['id'].sort_values().tolist()
+
+
+@st.cache_data(show_spinner=False)
+def _severity_fig(counts_key):
+    """Severity pie keyed on the (label, count) pairs themselves, so the
+    Python-heavy figure assembly only reruns when a count moves."""
+    labels = [k for k, _ in counts_key]
+    values = [v for _, v in counts_key]
+    return px.pie(
+        values=values,
+        names=labels,
+        title='Tickets by Severity',
+        color_discrete_sequence=px.colors.sequential.Plasma_r
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _status_fig(counts_key):
+    """Status bar, cached the same way as the severity pie."""
+    labels = [k for k, _ in counts_key]
+    values = [v for _, v in counts_key]
+    return px.bar(
+        x=labels,
+        y=values,
+        title='Tickets by Status',
+        color=labels,
+        color_discrete_map={'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'},
+        labels={'x': 'Status', 'y': 'Count'},
+    )
+
 
 # --- HELPER FUNCTIONS FOR CRUD OPERATIONS (In-memory) ---
 
@@ -96,28 +271,28 @@ def get_ticket_row(df, ticket_id):
     """Retrieves a single ticket row (Series) by ID, or None if not found."""
     if ticket_id is None:
         return None
-    filtered_df = df[df['id'] == ticket_id]
-    if not filtered_df.empty:
-        return filtered_df.iloc[0]
+    # The index carries the ids, so this is a hash probe, not a scan
+    if ticket_id in df.index:
+        return df.loc[ticket_id]
     return None
 
 def handle_add_ticket(new_data):
-    """Handles the 'Create' operation."""
-    current_df = st.session_state['tickets_df']
-    
-    # Calculate a new unique ID
-    new_id = current_df['id'].max() + 1 if not current_df.empty and 'id' in current_df.columns else 1000
-    
-    new_row = pd.DataFrame([{
+    """Handles the 'Create' operation by buffering the row until the next render."""
+    pending = st.session_state['pending_tickets']
+
+    # New unique ID straight off the session counter - constant time
+    new_id = st.session_state['next_id']
+    st.session_state['next_id'] += 1
+
+    # O(1) list append; _flush_pending_tickets does one concat for the
+    # whole batch instead of a full-frame copy per add
+    pending.append({
         'id': new_id,
         'title': new_data['title'],
         'severity': new_data['severity'],
         'status': 'Open',
         'timestamp': datetime.now(),
-    }])
-    
-    # Prepend the new ticket
-    st.session_state['tickets_df'] = pd.concat([new_row, current_df], ignore_index=True)
+    })
     st.success(f"Ticket '{new_data['title']}' added successfully (in memory). ID: {new_id}")
 
 def handle_update_ticket(ticket_id, updated_data):
@@ -127,11 +302,11 @@ def handle_update_ticket(ticket_id, updated_data):
         st.error("Cannot update: 'id' column is missing.")
         return
 
-    idx_to_update = current_df[current_df['id'] == ticket_id].index
-    
-    if not idx_to_update.empty:
-        for key, value in updated_data.items():
-            st.session_state['tickets_df'].loc[idx_to_update, key] = value
+    if ticket_id in current_df.index:
+        # One indexed assignment for every field - a single pass through
+        # pandas' __setitem__ machinery instead of one per key
+        current_df.loc[ticket_id, list(updated_data)] = list(updated_data.values())
+        st.session_state['tickets_rev'] += 1
         st.success(f"Ticket ID {ticket_id} updated successfully (in memory).")
     else:
         st.error(f"Ticket ID {ticket_id} not found for update.")
@@ -143,11 +318,11 @@ def handle_delete_ticket(ticket_id):
         st.error("Cannot delete: 'id' column is missing.")
         return
 
-    rows_before = len(current_df)
-    st.session_state['tickets_df'] = current_df[current_df['id'] != ticket_id].reset_index(drop=True)
-    rows_after = len(st.session_state['tickets_df'])
-
-    if rows_before > rows_after:
+    if ticket_id in current_df.index:
+        # Drop by index label - no mask over the id column and no
+        # reset_index copy afterwards
+        current_df.drop(index=ticket_id, inplace=True)
+        st.session_state['tickets_rev'] += 1
         st.success(f"Ticket ID {ticket_id} deleted successfully (in memory).")
     else:
         st.error(f"Ticket ID {ticket_id} not found for deletion.")
@@ -155,20 +330,44 @@ def handle_delete_ticket(ticket_id):
 
 # --- STREAMLIT PAGE FUNCTIONS ---
 
+PAGE_SIZE = 50
+
+
+def _show_ticket_page(df, key, height=350):
+    """One page of rows per rerun, picked with a page number input.
+
+    Whatever st.dataframe receives gets Arrow-serialised over the
+    WebSocket on every rerun, so the slice caps that wire cost at
+    PAGE_SIZE rows regardless of how many tickets exist.
+    """
+    pages = max(1, -(-len(df) // PAGE_SIZE))
+    page = st.number_input("Page", 1, pages, 1, key=key) if pages > 1 else 1
+    start = (page - 1) * PAGE_SIZE
+    st.dataframe(df.iloc[start:start + PAGE_SIZE], use_container_width=True, height=height)
+
+
 def display_dashboard(df):
     """Renders the main dashboard metrics and charts."""
     st.title("Tickets Dashboard Overview")
 
+    df = _flush_pending_tickets()
+
     if df.empty:
         st.info("No tickets to display.")
         return
         
+    # Served from the fingerprint-keyed cache; recomputed only when the
+    # frame actually changed
+    sev_counts, status_base, sorted_df = _dashboard_aggregates(_frame_fingerprint(df), df)
+
     # --- Metrics Section (Consistent with tickets) ---
     col1, col2, col3 = st.columns(3)
-    
+
+    # The charts' value_counts already hold both answers, so the metrics
+    # cost two dict reads instead of two more full-column comparisons
     total_tickets = len(df)
-    open_tickets = df[df['status'] == 'Open'].shape[0] if 'status' in df.columns else 0
-    critical_tickets = df[df['severity'] == 'Critical'].shape[0] if 'severity' in df.columns else 0
+    open_tickets = int(status_base.get('Open', 0))
+    critical_tickets = int(sev_counts.get('Critical', 0))
 
     col1.metric("Total Tickets", total_tickets)
     col2.metric("Open Tickets", open_tickets)
@@ -180,32 +379,17 @@ def display_dashboard(df):
     st.header("Ticket Analysis")
     chart_col1, chart_col2 = st.columns(2)
 
+    # Figures come out of a cache keyed on the handful of (label, count)
+    # pairs - unchanged counts mean no figure assembly at all
     if 'severity' in df.columns:
-        severity_counts = df['severity'].value_counts().reset_index()
-        severity_counts.columns = ['Severity', 'Count']
-        fig_severity = px.pie(
-            severity_counts, 
-            values='Count', 
-            names='Severity', 
-            title='Tickets by Severity',
-            color_discrete_sequence=px.colors.sequential.Plasma_r 
-        )
-        chart_col1.plotly_chart(fig_severity, use_container_width=True)
+        sev_key = tuple(zip(map(str, sev_counts.index), map(int, sev_counts)))
+        chart_col1.plotly_chart(_severity_fig(sev_key), use_container_width=True)
     else:
         chart_col1.warning("Cannot plot Severity: 'severity' column missing.")
 
     if 'status' in df.columns:
-        status_counts = df['status'].value_counts().reset_index()
-        status_counts.columns = ['Status', 'Count']
-        fig_status = px.bar(
-            status_counts, 
-            x='Status', 
-            y='Count', 
-            title='Tickets by Status',
-            color='Status',
-            color_discrete_map={'Open': '#EF4444', 'In Progress': '#F59E0B', 'Closed': '#10B981'},
-        )
-        chart_col2.plotly_chart(fig_status, use_container_width=True)
+        status_key = tuple(zip(map(str, status_base.index), map(int, status_base)))
+        chart_col2.plotly_chart(_status_fig(status_key), use_container_width=True)
     else:
         chart_col2.warning("Cannot plot Status: 'status' column missing.")
 
@@ -213,16 +397,19 @@ def display_dashboard(df):
 
     # --- Data Table Section ---
     st.header("All Tickets Data")
-    if 'timestamp' in df.columns:
-        df = df.sort_values(by='timestamp', ascending=False)
-    st.dataframe(df, use_container_width=True, height=350)
+    _show_ticket_page(sorted_df, key='dashboard_table_page')
 
 
 def display_crud_form(df):
     """Renders the Add Ticket (Create), Update, and Delete forms using tabs."""
     st.title("Ticket Management (Create, Update, Delete)")
-    
+
+    df = _flush_pending_tickets()
+
     can_manage = 'id' in df.columns
+    # Computed once per render (and cached across renders) for both the
+    # Update and Delete pickers, instead of a sort-and-listify per tab
+    ids_list = _sorted_ticket_ids(_frame_fingerprint(df), df) if can_manage and not df.empty else []
 
     create_tab, update_tab, delete_tab = st.tabs(["➕ Create New", "✏️ Update Existing", "🗑️ Delete Ticket"])
     
@@ -252,10 +439,8 @@ def display_crud_form(df):
         if can_manage and not df.empty:
             st.subheader("Update Ticket Details")
             
-            ticket_ids = df['id'].sort_values().tolist()
-            
             # Select the ID to update
-            selected_update_id = st.selectbox("Select Ticket ID to Update", ticket_ids, key='update_id_select')
+            selected_update_id = st.selectbox("Select Ticket ID to Update", ids_list, key='update_id_select')
             
             if selected_update_id is not None:
                 current_data = get_ticket_row(df, selected_update_id)
@@ -307,10 +492,8 @@ def display_crud_form(df):
         if can_manage and not df.empty:
             st.subheader("Delete Ticket")
             
-            delete_ids = df['id'].sort_values().tolist()
-            
             # Select the ID to delete
-            selected_delete_id = st.selectbox("Select Ticket ID to Delete", delete_ids, key='delete_id_select')
+            selected_delete_id = st.selectbox("Select Ticket ID to Delete", ids_list, key='delete_id_select')
 
             if selected_delete_id is not None:
                 st.warning(f"Are you sure you want to delete Ticket ID: **{selected_delete_id}**? This cannot be undone.")
@@ -326,10 +509,14 @@ def display_crud_form(df):
     st.markdown("---")
     
     st.subheader("Current Tickets List (Live View)")
-    # Sort the table to show newest tickets first for better visibility of CRUD operations
-    if 'timestamp' in df.columns:
-        df = df.sort_values(by='timestamp', ascending=False)
-    st.dataframe(df, use_container_width=True)
+    # Flush again: a Create submitted above buffered its row after the
+    # flush at the top of this render, and the Live View must show it.
+    # This is a no-op when nothing is pending.
+    df = _flush_pending_tickets()
+    # Newest tickets first for better visibility of CRUD operations;
+    # the sorted view comes from the same cache the dashboard uses
+    _, _, sorted_df = _dashboard_aggregates(_frame_fingerprint(df), df)
+    _show_ticket_page(sorted_df, key='live_view_page')
 
 
 # --- MAIN APPLICATION LOGIC ---
@@ -361,6 +548,22 @@ OPENAI_MODEL = "gpt-4.1-mini"
 MAX_RETRIES = 3
 SYSTEM_INSTRUCTION = "You are a Data Science Specialist"
 
+# Rolling window of turns included per request; keeps payload size,
+# prompt-processing time and token cost flat however long the chat runs
+HISTORY_WINDOW = 20
+
+
+@st.cache_resource
+def _openai_session():
+    """Shared keep-alive session: one TLS handshake for the whole process
+    instead of a fresh connection on every chat turn."""
+    session = requests.Session()
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Authorization': f'Bearer {API_KEY}'
+    })
+    return session
+
 # --- Security Check: Ensure User is Logged In ---
 # If the user hasn't logged in, they can't see the chat.
 if "logged_in" not in st.session_state or not st.session_state.logged_in:
@@ -379,13 +582,14 @@ if "messages" not in st.session_state:
 
 # --- API Call Logic ---
 def get_ai_response(prompt, history):
-    """Sends the user's prompt and chat history to the OpenAI API."""
+    """Streams the AI reply from the OpenAI API, yielding tokens as they arrive."""
     
-    # Format the Streamlit history into the structure the OpenAI API expects
+    # Format the Streamlit history into the structure the OpenAI API
+    # expects, keeping only the most recent HISTORY_WINDOW turns
     contents = []
-    # Note: OpenAI uses 'assistant' for the model's role, which matches Streamlit, 
+    # Note: OpenAI uses 'assistant' for the model's role, which matches Streamlit,
     # but the history messages need to be built explicitly.
-    for msg in history:
+    for msg in history[-HISTORY_WINDOW:]:
         # The history includes roles 'user' and 'assistant'
         contents.append({
             "role": msg["role"], 
@@ -404,44 +608,70 @@ def get_ai_response(prompt, history):
         "messages": [
             {"role": "system", "content": SYSTEM_INSTRUCTION},
             *contents # The full conversation history plus the system instruction
-        ]
+        ],
+        # Ask for server-sent events so tokens show up as they are
+        # generated instead of after the whole completion is done
+        "stream": True
     }
 
+    # Encode the body once, outside the retry loop - a retry resends the
+    # same bytes rather than re-serialising the whole conversation
+    body = json.dumps(payload_data)
+
     # Use the requests library to communicate with the API
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(
-                OPENAI_API_URL, # *** CHANGED API URL HERE ***
-                headers={
-                    'Content-Type': 'application/json',
-                    'Authorization': f'Bearer {API_KEY}' # *** ADDED AUTHORIZATION HEADER ***
-                }, 
-                data=json.dumps(payload_data)
+            # Headers (auth, content type) live on the pooled session
+            response = _openai_session().post(
+                OPENAI_API_URL,
+                data=body,
+                timeout=30,
+                stream=True
             )
-            response.raise_for_status() 
-            
-            result = response.json()
-            
-            # Extract the generated text from the structured JSON response
-            # NOTE: OpenAI uses 'message.content' inside 'choices[0]'
-            generated_text = result.get('choices', [{}])[0].get('message', {}).get('content')
-            
-            return generated_text if generated_text else "I couldn't generate a clear response for that request."
-            
+            response.raise_for_status()
+
+            # Each SSE "data:" line carries one JSON chunk with the next
+            # slice of the completion in choices[0].delta.content
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                line = line.decode('utf-8')
+                if not line.startswith('data:'):
+                    continue
+                chunk = line[len('data:'):].strip()
+                if chunk == '[DONE]':
+                    return
+                delta = json.loads(chunk).get('choices', [{}])[0].get('delta', {})
+                token = delta.get('content')
+                if token:
+                    yield token
+            return
+
         except requests.exceptions.RequestException as e:
             # Check for specific authentication errors (e.g., 401 Unauthorized)
             if response.status_code == 401:
-                return "Authentication Error: The API Key is invalid or expired. Please check your key."
-            
+                yield "Authentication Error: The API Key is invalid or expired. Please check your key."
+                return
+
             st.error(f"Connection Error: {e}")
             if attempt < MAX_RETRIES - 1:
                 wait_time = 2 ** attempt
-                time.sleep(wait_time) 
+                time.sleep(wait_time)
             else:
-                return "Failed to get a response after several tries. Check your connection or API status."
+                yield "Failed to get a response after several tries. Check your connection or API status."
+                return
         except Exception as e:
             st.error(f"An unexpected error occurred: {e}")
-            return "An internal error occurred."
+            yield "An internal error occurred."
+            return
+
+
+@st.cache_resource
+def _response_cache():
+    """Completed answers keyed by (prompt, history). A generator cannot go
+    through st.cache_data, so exact repeats are short-circuited here once
+    their stream has finished."""
+    return {}
 
 
 # --- Display Chat History ---
@@ -458,10 +688,15 @@ if prompt := st.chat_input("Ask me a coding question..."):
 
     # 2. Get AI response and display it
     with st.chat_message("assistant"):
-        with st.spinner("AI is thinking..."):
-            # Send the prompt and the history 
-            assistant_response = get_ai_response(prompt, st.session_state.messages) 
+        # Exact repeats replay the stored answer; everything else streams
+        # token by token as it arrives
+        history_key = tuple((m["role"], m["content"]) for m in st.session_state.messages)
+        assistant_response = _response_cache().get((prompt, history_key))
+        if assistant_response is not None:
             st.markdown(assistant_response)
+        else:
+            assistant_response = st.write_stream(get_ai_response(prompt, st.session_state.messages))
+            _response_cache()[(prompt, history_key)] = assistant_response
 
     # 3. Add AI response to session state
     st.session_state.messages.append({"role": "assistant", "content": assistant_response})
\ No newline at end of file